@@ -1,9 +1,15 @@
+import io
+import json
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+import asyncio
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Query, Header
+from fastapi.responses import StreamingResponse
 from app.core.security import api_key_auth
-from app.schemas.responses import ReportResponse, CreateReportResponse
+from app.schemas.responses import ReportResponse, CreateReportResponse, ReportListResponse, SearchResponse
 from app.services.repository import ReportRepository
-from app.services.document_ai import DocumentAIService
+from app.services.document_ai import DocumentAIService, ProgressCallback, no_progress
 from app.services.storage import StorageService 
 from app.core.dependencies import get_repo, get_storage_service
 
@@ -14,12 +20,77 @@ router = APIRouter(
     dependencies=[Depends(api_key_auth)],
 )
 
+# Keeps streamed processing tasks referenced until they finish.
+_background_tasks = set()
+
 def get_document_ai_service() -> DocumentAIService:
     return DocumentAIService()
 
+async def _process_report(
+    file_obj,
+    filename: str,
+    content_type: str,
+    repo: ReportRepository,
+    doc_service: DocumentAIService,
+    storage_service: StorageService,
+    on_progress: ProgressCallback = no_progress
+):
+    file_extension = filename.split(".")[-1]
+    unique_filename = f"{uuid.uuid4()}.{file_extension}"
+
+    gcs_uri = await storage_service.upload_file(
+        file_obj=file_obj, 
+        destination_blob_name=unique_filename,
+        content_type=content_type
+    )
+    on_progress("uploaded", {})
+
+    report = await doc_service.process_document(gcs_uri, storage_service, on_progress=on_progress)
+    
+    # Firestore calls block, so they run off the event loop like the Document AI calls.
+    await asyncio.to_thread(repo.save, report)
+    on_progress("saved", {"report_id": report.id})
+
+    return report
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _stream_report(file_obj, filename: str, content_type: str, repo, doc_service, storage_service):
+    """
+    Runs the pipeline as a task and relays its progress callbacks through a queue,
+    so each event is pushed as soon as its stage finishes. The task is not tied to
+    the connection: if the client disconnects, the report is still processed and saved.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_progress(event: str, data: dict) -> None:
+        queue.put_nowait((event, data))
+
+    async def run():
+        try:
+            report = await _process_report(
+                file_obj, filename, content_type, repo, doc_service, storage_service, on_progress
+            )
+            on_progress("completed", {"report_id": report.id, "status": "processed"})
+        except Exception as e:
+            print(f"Error processing report: {e}")
+            on_progress("error", {"detail": str(e)})
+
+    task = asyncio.create_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    while True:
+        event, data = await queue.get()
+        yield _sse_event(event, data)
+        if event in ("completed", "error"):
+            break
+
 @router.post("", response_model=CreateReportResponse, status_code=status.HTTP_201_CREATED)
 async def create_report(
     file: UploadFile = File(...),
+    accept: Optional[str] = Header(None),
     repo: ReportRepository = Depends(get_repo),
     doc_service: DocumentAIService = Depends(get_document_ai_service),
     storage_service: StorageService = Depends(get_storage_service)
@@ -30,19 +101,19 @@ async def create_report(
             detail="Only PDF files are allowed."
         )
 
-    try:
-        file_extension = file.filename.split(".")[-1]
-        unique_filename = f"{uuid.uuid4()}.{file_extension}"
-
-        gcs_uri = await storage_service.upload_file(
-            file_obj=file.file, 
-            destination_blob_name=unique_filename,
-            content_type=file.content_type
+    if accept and "text/event-stream" in accept:
+        # The upload is closed once this handler returns, so the stream works on a copy.
+        file_obj = io.BytesIO(await file.read())
+        return StreamingResponse(
+            _stream_report(file_obj, file.filename, file.content_type, repo, doc_service, storage_service),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
-        report = await doc_service.process_document(gcs_uri, storage_service)
-        
-        repo.save(report)
+    try:
+        report = await _process_report(
+            file.file, file.filename, file.content_type, repo, doc_service, storage_service
+        )
         
         return {
                 "report_id": report.id,
@@ -57,6 +128,45 @@ async def create_report(
             detail=str(e)
         )
 
+@router.get("", response_model=ReportListResponse)
+def list_reports(
+    patient_name: Optional[str] = None,
+    owner_name: Optional[str] = None,
+    species: Optional[str] = None,
+    clinic: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    repo: ReportRepository = Depends(get_repo),
+):
+    try:
+        reports, next_cursor = repo.find(
+            patient_name=patient_name,
+            owner_name=owner_name,
+            species=species,
+            clinic=clinic,
+            created_from=created_from,
+            created_to=created_to,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {
+        "reports": reports,
+        "next_cursor": next_cursor,
+    }
+
+@router.get("/search", response_model=SearchResponse)
+def search_reports(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    repo: ReportRepository = Depends(get_repo),
+):
+    return {"results": repo.search(q, limit=limit)}
+
 @router.get("/{report_id}")
 def get_report(
     report_id: str,
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     DOCUMENT_AI_PROCESSOR_ID: str
     GCS_BUCKET_NAME: str
     API_KEY: str
+    PROFILING_ENABLED: bool = False
 
     def resolved_project_id(self) -> str:
         if self.PROJECT_ID:
@@ -0,0 +1,54 @@
+import io
+import cProfile
+import pstats
+from app.core.config import get_settings
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_TOP_N = 30
+
+_profiling_active = False
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that profiles a single request with cProfile when it
+    sends `X-Profile: true` together with a valid API key, and prints the top
+    functions by cumulative time. Profiling lasts until the response body has
+    been fully sent, so streamed (SSE) responses are covered end to end.
+
+    cProfile traces the whole event loop thread: anything else running on the
+    loop while the request is in flight, including other requests, is included
+    in the output. Work in asyncio.to_thread is not captured. Only one request
+    is profiled at a time since cProfile cannot nest.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _profiling_active
+
+        if scope["type"] != "http" or _profiling_active or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        _profiling_active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            _profiling_active = False
+
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            print(f"PROFILE {scope['method']} {scope['path']}:\n{output.getvalue()}")
+
+    @staticmethod
+    def _wants_profile(scope) -> bool:
+        headers = dict(scope.get("headers") or [])
+        return (
+            headers.get(PROFILE_HEADER, b"").lower() == b"true"
+            and headers.get(b"x-api-key", b"").decode("latin-1") == get_settings().API_KEY
+        )
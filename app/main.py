@@ -1,11 +1,16 @@
 from fastapi import FastAPI, Depends
 from fastapi.responses import RedirectResponse
 from app.core.security import api_key_auth
+from app.core.config import get_settings
+from app.core.profiling import ProfilingMiddleware
 from app.api.routes import router as report_router
 from app.services.firestore_repository import FirestoreReportRepository
 
 app = FastAPI(title="DiagnoVET Backend")
 
+if get_settings().PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
 repo = FirestoreReportRepository()
 
 app.include_router(report_router)
@@ -35,4 +35,16 @@ class Report(BaseModel):
 
     created_at: datetime = Field(
     default_factory=lambda: datetime.now(timezone.utc)
-)
\ No newline at end of file
+)
+
+
+class ReportSummary(BaseModel):
+    id: str
+    patient: Patient
+    owner: Owner
+    veterinarian: Veterinarian
+    created_at: datetime
+
+
+class ReportSearchResult(ReportSummary):
+    score: float
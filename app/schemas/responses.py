@@ -1,5 +1,6 @@
+from typing import List, Optional
 from pydantic import BaseModel
-from app.schemas.domain import Report
+from app.schemas.domain import Report, ReportSummary, ReportSearchResult
 
 class CreateReportResponse(BaseModel):
     report_id: str
@@ -7,3 +8,10 @@ class CreateReportResponse(BaseModel):
 
 class ReportResponse(BaseModel):
     report: Report
+
+class ReportListResponse(BaseModel):
+    reports: List[ReportSummary]
+    next_cursor: Optional[str] = None
+
+class SearchResponse(BaseModel):
+    results: List[ReportSearchResult]
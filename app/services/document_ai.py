@@ -1,7 +1,7 @@
-import io
 import uuid
 import json 
-from typing import List
+import asyncio
+from typing import Callable, List
 from google.api_core.exceptions import InvalidArgument
 from google.cloud import documentai_v1 as documentai
 from google.api_core.client_options import ClientOptions
@@ -9,6 +9,14 @@ from app.core.config import get_settings
 from app.services.report_parser import ReportParser
 from app.services.storage import StorageService
 
+# Receives (event, data) as each processing stage completes.
+ProgressCallback = Callable[[str, dict], None]
+
+
+def no_progress(event: str, data: dict) -> None:
+    pass
+
+
 class DocumentAIService:
     def __init__(self):
         """Initialize Document AI client with location-specific endpoint."""
@@ -22,7 +30,8 @@ class DocumentAIService:
         self, 
         gcs_uri: str, 
         storage_service: StorageService, 
-        mime_type: str = "application/pdf"
+        mime_type: str = "application/pdf",
+        on_progress: ProgressCallback = no_progress
     ):
         """
         Main entry point for document processing.
@@ -48,7 +57,8 @@ class DocumentAIService:
                     ocr_config=documentai.OcrConfig(enable_native_pdf_parsing=True)
                 )
             )
-            result = self.client.process_document(request=request)
+            on_progress("ocr_online_started", {})
+            result = await asyncio.to_thread(self.client.process_document, request=request)
             document = result.document
             print("Online processing successful.")
 
@@ -56,14 +66,16 @@ class DocumentAIService:
             
             if "PAGE_LIMIT_EXCEEDED" in str(e):
                 print(f"Limit exceeded ({e}). Switching to Batch Processing...")
-                document = await self._process_batch(gcs_uri, processor_name, storage_service)
+                on_progress("ocr_batch_started", {})
+                document = await self._process_batch(gcs_uri, processor_name, storage_service, on_progress)
             else:
                 
                 raise e
         parser = ReportParser(document.text)
         report_data = parser.parse()
+        on_progress("parsed", {})
 
-        image_urls = await self._extract_and_upload_images(document, storage_service)
+        image_urls = await self._extract_and_upload_images(document, storage_service, on_progress)
         
         
         if hasattr(report_data, "image_urls"):
@@ -71,7 +83,13 @@ class DocumentAIService:
         
         return report_data
 
-    async def _process_batch(self, gcs_uri: str, processor_name: str, storage_service: StorageService):
+    async def _process_batch(
+        self,
+        gcs_uri: str,
+        processor_name: str,
+        storage_service: StorageService,
+        on_progress: ProgressCallback = no_progress
+    ):
         """Handles large documents using asynchronous Batch Processing."""
         output_prefix = f"batch_results/{uuid.uuid4()}"
         output_gcs_uri = f"gs://{self.settings.GCS_BUCKET_NAME}/{output_prefix}"
@@ -94,7 +112,7 @@ class DocumentAIService:
         operation = self.client.batch_process_documents(request=request)
         
         print("Waiting for Batch processing to complete...")
-        operation.result(timeout=300)
+        await asyncio.to_thread(operation.result, timeout=300)
         print("Batch complete. Downloading results...")
 
         blobs = await storage_service.list_files(prefix=output_prefix)
@@ -106,8 +124,9 @@ class DocumentAIService:
         combined_document = documentai.Document()
 
         
-        for blob in json_blobs:
+        for shard, blob in enumerate(json_blobs, start=1):
             json_data = await storage_service.read_json_file(blob.name)
+            on_progress("shard_downloaded", {"shard": shard, "total": len(json_blobs)})
             shard_doc = documentai.Document.from_json(json.dumps(json_data))
             
             if shard_doc.text:
@@ -120,26 +139,30 @@ class DocumentAIService:
         
         return combined_document
 
-    async def _extract_and_upload_images(self, document, storage_service: StorageService) -> List[str]:
-        """Extracts page images and uploads them as JPEGs to GCS."""
+    async def _extract_and_upload_images(
+        self,
+        document,
+        storage_service: StorageService,
+        on_progress: ProgressCallback = no_progress
+    ) -> List[str]:
+        """
+        Extracts page images and stores them as JPEGs in GCS, addressed by content hash.
+        Pages already stored (letterheads, cover pages, resubmitted reports) are not uploaded again.
+        """
         urls = []
+        total_pages = len(document.pages)
         
         for i, page in enumerate(document.pages):
             if page.image and page.image.content:
                 try:
-                    image_content = page.image.content
-                    file_obj = io.BytesIO(image_content)
-                    
-                    
-                    unique_id = uuid.uuid4()
-                    filename = f"images/{unique_id}/page_{i+1}.jpeg"
-                    
-                    gcs_uri = await storage_service.upload_file(
-                        file_obj=file_obj,
-                        destination_blob_name=filename,
+                    gcs_uri = await storage_service.upload_content_addressed(
+                        content=page.image.content,
+                        prefix="images",
+                        extension="jpeg",
                         content_type="image/jpeg"
                     )
                     urls.append(gcs_uri)
+                    on_progress("page_image_uploaded", {"page": i + 1, "total": total_pages})
                 except Exception as e:
                     print(f"Error processing page {i+1}: {e}")
                     continue
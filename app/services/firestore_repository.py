@@ -1,16 +1,140 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
 from google.cloud import firestore
-from app.schemas.domain import Report
+from google.cloud.firestore_v1.field_path import FieldPath
+from google.cloud.firestore_v1.base_query import FieldFilter
+from app.schemas.domain import Report, ReportSummary, ReportSearchResult
+from app.services import search as search_index
+from app.services.normalization import normalize
 from app.services.repository import ReportRepository
 
+SUMMARY_FIELDS = ["id", "patient", "owner", "veterinarian", "created_at"]
+POSTINGS_PER_TERM = 200
+# Each term costs one read and up to two writes, well under the 500-write transaction limit.
+TERMS_PER_TRANSACTION = 150
+
+
+def _filters_key(equality_filters: dict, created_from: Optional[datetime], created_to: Optional[datetime]) -> str:
+    """Short fingerprint of the filters, so a cursor cannot be replayed against a different query."""
+    raw = json.dumps(
+        [equality_filters, created_from and created_from.isoformat(), created_to and created_to.isoformat()],
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_cursor(created_at: datetime, report_id: str, filters_key: str) -> str:
+    payload = json.dumps({"c": created_at.isoformat(), "id": report_id, "f": filters_key})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, filters_key: str) -> Tuple[datetime, str]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created_at, report_id, cursor_filters = datetime.fromisoformat(payload["c"]), payload["id"], payload["f"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if cursor_filters != filters_key:
+        raise ValueError("Cursor does not match the current filters.")
+    return created_at, report_id
+
+
+@firestore.transactional
+def _apply_postings(transaction, search_terms, report_id: str, updates: list) -> None:
+    """
+    Applies (term, posting) updates for one report; a None posting removes the term.
+    `df` moves only when the posting is created or deleted, so reapplying is a no-op.
+    """
+    refs = [search_terms.document(term).collection("postings").document(report_id) for term, _ in updates]
+    existing = {snap.reference.path for snap in transaction.get_all(refs) if snap.exists}
+
+    for (term, posting), ref in zip(updates, refs):
+        term_ref = search_terms.document(term)
+        if posting is None:
+            if ref.path in existing:
+                transaction.delete(ref)
+                transaction.set(term_ref, {"df": firestore.Increment(-1)}, merge=True)
+        else:
+            transaction.set(ref, posting)
+            if ref.path not in existing:
+                transaction.set(term_ref, {"df": firestore.Increment(1)}, merge=True)
+
+
+@firestore.transactional
+def _finish_indexing(transaction, doc_ref, stats_ref, terms: List[str], length: int) -> None:
+    """
+    Marks the report indexed and adjusts the corpus counters. `search.length` is
+    only written here, so its presence means the report is already counted.
+    """
+    snapshot = doc_ref.get(field_paths=["search"], transaction=transaction)
+    counted_length = ((snapshot.to_dict() or {}).get("search") or {}).get("length")
+
+    transaction.set(stats_ref, {
+        "documents": firestore.Increment(0 if counted_length is not None else 1),
+        "total_length": firestore.Increment(length - (counted_length or 0)),
+    }, merge=True)
+    transaction.update(doc_ref, {
+        "search": {"status": "indexed", "terms": terms, "length": length},
+    })
+
+
 class FirestoreReportRepository(ReportRepository):
     def __init__(self):
         self.client = firestore.Client()
         self.collection = self.client.collection("reports")
+        self.search_terms = self.client.collection("search_terms")
+        self.search_stats = self.client.collection("search_stats").document("corpus")
 
     def save(self, report: Report) -> Report:
-        self.collection.document(report.id).set(
-            report.model_dump(mode="json")
+        """
+        Writes the report and keeps the search index in step with it: one posting
+        per distinct term under `search_terms/{term}/postings/{report_id}`, the
+        term's document frequency, and corpus-wide document and length counters.
+
+        The report is written first with `search.status = "pending"`, so an
+        interrupted run is visible to scripts/backfill_indexes.py. Postings are
+        then applied in transactions that only change `df` when a posting is
+        actually created or removed, and the corpus counters are settled in a
+        final transaction against the report's previously counted length. Saving
+        the same report again, or concurrently, therefore never double-counts.
+        """
+        doc_ref = self.collection.document(report.id)
+        previous = doc_ref.get(field_paths=["search.terms"])
+        previous_terms = set(((previous.to_dict() or {}).get("search") or {}).get("terms", [])) if previous.exists else set()
+
+        search = search_index.index_fields(report)
+        tf, length = search["tf"], search["length"]
+
+        stats = self.search_stats.get().to_dict() or {}
+        documents = stats.get("documents", 0)
+        avg_length = stats.get("total_length", 0) / documents if documents else length
+
+        # merge=True keeps the previous `search.terms` and `search.length` until indexing finishes.
+        doc_ref.set(
+            {
+                **report.model_dump(mode="json"),
+                "index": self._index_fields(report),
+                "search": {"status": "pending"},
+            },
+            merge=True,
         )
+
+        updates = [
+            (term, {"tf": freq, "impact": search_index.impact(freq, length, avg_length)})
+            for term, freq in tf.items()
+        ]
+        updates += [(term, None) for term in previous_terms - set(tf)]
+        for start in range(0, len(updates), TERMS_PER_TRANSACTION):
+            _apply_postings(
+                self.client.transaction(), self.search_terms, report.id,
+                updates[start:start + TERMS_PER_TRANSACTION],
+            )
+
+        _finish_indexing(self.client.transaction(), doc_ref, self.search_stats, sorted(tf), length)
         return report
 
     def get(self, report_id: str) -> Report | None:
@@ -18,3 +142,111 @@ class FirestoreReportRepository(ReportRepository):
         if not doc.exists:
             return None
         return Report(**doc.to_dict())
+
+    def find(
+        self,
+        patient_name: Optional[str] = None,
+        owner_name: Optional[str] = None,
+        species: Optional[str] = None,
+        clinic: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReportSummary], Optional[str]]:
+        """
+        Equality filters hit the normalised `index.*` fields and are served by
+        the composite indexes in firestore.indexes.json. Pagination resumes
+        after the (created_at, id) encoded in the cursor, so deep pages cost
+        the same as the first and no extra document read is needed.
+        """
+        query = self.collection
+
+        equality_filters = {
+            "index.patient_name": normalize(patient_name),
+            "index.owner_name": normalize(owner_name),
+            "index.species": normalize(species),
+            "index.clinic": normalize(clinic),
+        }
+        for field, value in equality_filters.items():
+            if value:
+                query = query.where(filter=FieldFilter(field, "==", value))
+
+        if created_from:
+            query = query.where(filter=FieldFilter("index.created_at", ">=", created_from))
+        if created_to:
+            query = query.where(filter=FieldFilter("index.created_at", "<", created_to))
+
+        query = (
+            query
+            .order_by("index.created_at", direction=firestore.Query.DESCENDING)
+            .order_by(FieldPath.document_id(), direction=firestore.Query.DESCENDING)
+        )
+
+        filters_key = _filters_key(equality_filters, created_from, created_to)
+        if cursor:
+            created_at, report_id = _decode_cursor(cursor, filters_key)
+            query = query.start_after({"index.created_at": created_at, "__name__": report_id})
+
+        # One extra document tells us whether another page exists without a count query.
+        docs = list(query.select(SUMMARY_FIELDS + ["index.created_at"]).limit(limit + 1).stream())
+
+        summaries = [ReportSummary(**doc.to_dict()) for doc in docs[:limit]]
+        next_cursor = None
+        if len(docs) > limit:
+            last = docs[limit - 1]
+            next_cursor = _encode_cursor(last.get("index.created_at"), last.id, filters_key)
+        return summaries, next_cursor
+
+    def search(self, q: str, limit: int = 20) -> List[ReportSearchResult]:
+        """
+        Reads the head of each query term's posting list, ordered by stored impact,
+        and combines them with corpus-level idf. Reports outside the top
+        POSTINGS_PER_TERM of every query term cannot be returned; for single-term
+        queries the ranking is exact.
+        """
+        terms = search_index.query_terms(q)
+        if not terms:
+            return []
+
+        term_snapshots = self.client.get_all([self.search_terms.document(term) for term in terms])
+        df = {snap.id: snap.get("df") for snap in term_snapshots if snap.exists and snap.get("df") > 0}
+        if not df:
+            return []
+        n_docs = (self.search_stats.get().to_dict() or {}).get("documents", 0)
+
+        postings = {}
+        for term in df:
+            docs = (
+                self.search_terms.document(term).collection("postings")
+                .order_by("impact", direction=firestore.Query.DESCENDING)
+                .limit(POSTINGS_PER_TERM)
+                .stream()
+            )
+            postings[term] = [(doc.id, doc.get("impact")) for doc in docs]
+
+        ranked = search_index.rank(postings, df, n_docs, limit)
+        if not ranked:
+            return []
+
+        report_snapshots = self.client.get_all(
+            [self.collection.document(report_id) for report_id, _ in ranked],
+            field_paths=SUMMARY_FIELDS,
+        )
+        summaries = {snap.id: snap.to_dict() for snap in report_snapshots if snap.exists}
+        return [
+            ReportSearchResult(**summaries[report_id], score=score)
+            for report_id, score in ranked
+            if report_id in summaries
+        ]
+
+    @staticmethod
+    def _index_fields(report: Report) -> dict:
+        """Normalised copies of the filterable fields, written alongside the report."""
+        return {
+            "patient_name": normalize(report.patient.name),
+            "owner_name": normalize(report.owner.name),
+            "species": normalize(report.patient.species),
+            "clinic": normalize(report.veterinarian.clinic),
+            "created_at": report.created_at,
+        }
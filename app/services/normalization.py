@@ -0,0 +1,17 @@
+import re
+import unicodedata
+from typing import Optional
+
+
+def fold_accents(value: str) -> str:
+    """Removes diacritics so 'Clínica' and 'Clinica' compare equal."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize(value: Optional[str]) -> Optional[str]:
+    """Canonical form used for index fields: accent-folded, lowercase, single-spaced."""
+    if not value:
+        return None
+    normalized = re.sub(r"\s+", " ", fold_accents(value)).strip().lower()
+    return normalized or None
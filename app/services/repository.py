@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from app.schemas.domain import Report
+from datetime import datetime
+from typing import List, Optional, Tuple
+from app.schemas.domain import Report, ReportSummary, ReportSearchResult
 
 class ReportRepository(ABC):
 
@@ -11,6 +13,29 @@ class ReportRepository(ABC):
     def get(self, report_id: str) -> Report | None:
         pass
 
+    @abstractmethod
+    def find(
+        self,
+        patient_name: Optional[str] = None,
+        owner_name: Optional[str] = None,
+        species: Optional[str] = None,
+        clinic: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReportSummary], Optional[str]]:
+        """
+        Returns one page of reports (newest first) matching the filters,
+        plus the cursor for the next page or None when exhausted.
+        """
+        pass
+
+    @abstractmethod
+    def search(self, q: str, limit: int = 20) -> List[ReportSearchResult]:
+        """Full-text search over diagnosis and recommendations, best match first."""
+        pass
+
 
 """class InMemoryReportRepository(ReportRepository):
     def __init__(self):
@@ -0,0 +1,90 @@
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+from app.schemas.domain import Report
+from app.services.normalization import normalize
+
+STOP_WORDS = {
+    "a", "al", "ante", "con", "de", "del", "el", "en", "entre", "es", "la", "las",
+    "lo", "los", "no", "o", "para", "por", "se", "sin", "su", "sus", "un", "una",
+    "y", "que", "como", "mas", "muy", "sobre", "le", "les",
+}
+
+# Light Spanish stemmer: strips derivational suffixes, then plural and gender endings.
+DERIVATIONAL_SUFFIXES = ["mente", "idades", "idad"]
+
+MAX_QUERY_TERMS = 10
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def stem(word: str) -> str:
+    if len(word) <= 4:
+        return word
+    for suffix in DERIVATIONAL_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            word = word[: -len(suffix)]
+            break
+    if word.endswith("es") and len(word) > 5 and word[-3] not in "aeiou":
+        word = word[:-2]
+    elif word.endswith("s"):
+        word = word[:-1]
+    if word[-1] in "aoe" and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def analyze(text: Optional[str]) -> List[str]:
+    """Accent-folds, tokenizes and stems text, dropping stop words."""
+    normalized = normalize(text)
+    if not normalized:
+        return []
+    return [stem(token) for token in re.findall(r"[a-z0-9]+", normalized) if token not in STOP_WORDS]
+
+
+def index_fields(report: Report) -> dict:
+    """Term frequencies and token count of the searchable text of a report."""
+    tokens = analyze(report.diagnosis) + analyze(report.recommendations)
+    return {
+        "tf": dict(Counter(tokens)),
+        "length": len(tokens),
+    }
+
+
+def query_terms(q: str) -> List[str]:
+    return list(dict.fromkeys(analyze(q)))[:MAX_QUERY_TERMS]
+
+
+def impact(tf: int, length: int, avg_length: float) -> float:
+    """
+    BM25 term weight without the idf factor. It only depends on the report itself
+    and the corpus average length, so it is computed once on save and stored in
+    the posting, where it orders the posting list.
+    """
+    length_norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (avg_length or 1.0))
+    return tf * (BM25_K1 + 1) / (tf + length_norm)
+
+
+def idf(df: int, n_docs: int) -> float:
+    return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+
+def rank(
+    postings: Dict[str, List[Tuple[str, float]]],
+    df: Dict[str, int],
+    n_docs: int,
+    limit: int,
+) -> List[Tuple[str, float]]:
+    """
+    Combines per-term posting lists of (report_id, impact) into BM25 scores,
+    using corpus-level document frequencies, and keeps the top `limit` via a heap.
+    """
+    scores: Dict[str, float] = defaultdict(float)
+    for term, term_postings in postings.items():
+        term_idf = idf(df.get(term, 0), n_docs)
+        for report_id, term_impact in term_postings:
+            scores[report_id] += term_idf * term_impact
+
+    return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
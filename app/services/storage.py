@@ -2,11 +2,38 @@ import os
 import asyncio
 import json
 import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import storage
 from google.auth import impersonated_credentials
 from google.auth import default as auth_default
 from app.core.config import get_settings
 
+KNOWN_BLOBS_CACHE_SIZE = 50_000
+
+# Content-addressed blobs known to exist, shared by every StorageService in the process.
+_known_blobs: "OrderedDict[str, None]" = OrderedDict()
+_known_blobs_lock = threading.Lock()
+
+
+def _is_known_blob(blob_name: str) -> bool:
+    with _known_blobs_lock:
+        if blob_name in _known_blobs:
+            _known_blobs.move_to_end(blob_name)
+            return True
+        return False
+
+
+def _remember_blob(blob_name: str) -> None:
+    with _known_blobs_lock:
+        _known_blobs[blob_name] = None
+        _known_blobs.move_to_end(blob_name)
+        if len(_known_blobs) > KNOWN_BLOBS_CACHE_SIZE:
+            _known_blobs.popitem(last=False)
+
+
 class StorageService:
     def __init__(self):
         self.settings = get_settings()
@@ -95,6 +122,31 @@ class StorageService:
         blob.upload_from_file(file_obj, content_type=content_type)
         return f"gs://{self.bucket_name}/{destination_blob_name}"
 
+    async def upload_content_addressed(self, content: bytes, prefix: str, extension: str, content_type: str) -> str:
+        """Stores content under its SHA-256 digest; content already stored is not written again."""
+        return await asyncio.to_thread(self._upload_content_addressed_sync, content, prefix, extension, content_type)
+
+    def _upload_content_addressed_sync(self, content: bytes, prefix: str, extension: str, content_type: str) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        blob_name = f"{prefix}/{digest}.{extension}"
+        gcs_uri = f"gs://{self.bucket_name}/{blob_name}"
+
+        if _is_known_blob(blob_name):
+            return gcs_uri
+
+        bucket = self.client.bucket(self.bucket_name)
+        blob = bucket.blob(blob_name)
+        try:
+            # if_generation_match=0 only writes if the blob does not exist yet, so a page
+            # stored earlier (or by a concurrent request) costs a single rejected request
+            # instead of an existence check before every new page.
+            blob.upload_from_string(content, content_type=content_type, if_generation_match=0)
+        except PreconditionFailed:
+            pass
+
+        _remember_blob(blob_name)
+        return gcs_uri
+
     async def list_files(self, prefix: str):
         return await asyncio.to_thread(self._list_files_sync, prefix)
 
@@ -0,0 +1,58 @@
+import argparse
+
+from google.cloud.firestore_v1.field_path import FieldPath
+from app.schemas.domain import Report
+from app.services.firestore_repository import FirestoreReportRepository
+
+
+def run_backfill(batch_size: int, only_missing: bool) -> None:
+    """
+    Re-saves stored reports through the repository, which rewrites their
+    `index` and `search` fields. By default only reports never indexed, or left
+    `pending` by an interrupted save, are processed. Reports are read in pages
+    ordered by id, and saves are idempotent, so the scan can be interrupted,
+    rerun, or run alongside live traffic.
+    """
+    repo = FirestoreReportRepository()
+    processed = skipped = 0
+    last_id = None
+
+    while True:
+        query = repo.collection.order_by(FieldPath.document_id()).limit(batch_size)
+        if last_id:
+            query = query.start_after({"__name__": last_id})
+
+        docs = list(query.stream())
+        if not docs:
+            break
+
+        for doc in docs:
+            data = doc.to_dict()
+            if only_missing and "index" in data and (data.get("search") or {}).get("status") == "indexed":
+                skipped += 1
+                continue
+            repo.save(Report(**data))
+            processed += 1
+
+        last_id = docs[-1].id
+        print(f"Re-indexed {processed} reports ({skipped} already indexed)...")
+
+    print(f"Backfill complete. Re-indexed: {processed}. Skipped: {skipped}.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Backfills listing and search index fields for existing reports (run as: python -m scripts.backfill_indexes)"
+    )
+
+    parser.add_argument("--batch-size", type=int, default=200, help="Reports read per page")
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Re-index every report, not only those missing or pending"
+    )
+
+    args = parser.parse_args()
+
+    run_backfill(args.batch_size, only_missing=not args.all)
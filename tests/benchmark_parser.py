@@ -0,0 +1,164 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from app.services.report_parser import ReportParser
+from tests.synthetic_reports import EXPECTED_FIELDS, LAYOUTS, generate_report
+
+DEFAULT_PAGES = [1, 30, 300]
+
+ACCURACY_BASELINE = Path(__file__).parent / "samples" / "parser_accuracy_baseline.json"
+ACCURACY_SEEDS = 20
+ACCURACY_PAGES = 2
+
+
+def field_value(report, path: str):
+    value = report
+    for attr in path.split("."):
+        value = getattr(value, attr)
+    return value
+
+
+def measure_accuracy(layout: str, seeds: int = ACCURACY_SEEDS, pages: int = ACCURACY_PAGES) -> dict:
+    """Fraction of synthetic reports for which each field is extracted exactly."""
+    hits = defaultdict(int)
+    for seed in range(seeds):
+        sample = generate_report(pages=pages, layout=layout, seed=seed)
+        report = ReportParser(sample.text).parse()
+        for path in EXPECTED_FIELDS:
+            if field_value(report, path) == sample.expected[path]:
+                hits[path] += 1
+    return {path: hits[path] / seeds for path in EXPECTED_FIELDS}
+
+
+def load_accuracy_baseline() -> dict:
+    if not ACCURACY_BASELINE.exists():
+        return {}
+    return json.loads(ACCURACY_BASELINE.read_text(encoding="utf-8"))
+
+
+def run_accuracy(layouts, update_baseline: bool) -> bool:
+    """Prints per-field accuracy and fails if any field drops below the stored baseline."""
+    ok = True
+    baseline = load_accuracy_baseline()
+    measured = {}
+
+    for layout in layouts:
+        measured[layout] = measure_accuracy(layout)
+        print(f"\n[{layout}] field accuracy over {ACCURACY_SEEDS} reports")
+        for path, accuracy in measured[layout].items():
+            expected = baseline.get(layout, {}).get(path)
+            note = ""
+            if expected is not None and accuracy < expected:
+                note = f"  REGRESSION (baseline {expected:.0%})"
+                ok = False
+            elif expected is not None and accuracy > expected:
+                note = f"  improved (baseline {expected:.0%}), run with --update-baseline"
+            print(f"    {path:<25} {accuracy:6.0%}{note}")
+
+    if update_baseline:
+        ACCURACY_BASELINE.write_text(json.dumps({**baseline, **measured}, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {ACCURACY_BASELINE}")
+        return True
+
+    return ok
+
+
+def instrument(parser: ReportParser, timings: dict) -> None:
+    """Wraps the parser's extraction methods so every call is timed, keyed by its first label."""
+    for name in ("_extract_field", "_extract_block"):
+        original = getattr(parser, name)
+
+        def timed(*args, _original=original, _name=name, **kwargs):
+            keys = args[0] if args else kwargs.get("keys") or kwargs.get("start_keys")
+            start = time.perf_counter()
+            result = _original(*args, **kwargs)
+            timings[f"{_name}({keys[0]})"].append(time.perf_counter() - start)
+            return result
+
+        setattr(parser, name, timed)
+
+
+def run_benchmark(pages_list, layouts, repeat: int, top: int, max_ms_per_mb: float | None) -> bool:
+    ok = True
+
+    for layout in layouts:
+        for pages in pages_list:
+            text = generate_report(pages=pages, layout=layout).text
+            size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+
+            parse_times = []
+            call_timings = defaultdict(list)
+            for _ in range(repeat):
+                parser = ReportParser(text)
+                instrument(parser, call_timings)
+                start = time.perf_counter()
+                parser.parse()
+                parse_times.append(time.perf_counter() - start)
+
+            median_ms = statistics.median(parse_times) * 1000
+            ms_per_mb = median_ms / size_mb
+            print(
+                f"\n[{layout}, {pages} pages] {size_mb:.3f} MB | parse() median {median_ms:.2f} ms "
+                f"| {size_mb / (median_ms / 1000):.2f} MB/s"
+            )
+
+            slowest = sorted(call_timings.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+            for label, samples in slowest[:top]:
+                print(f"    {label:<55} median {statistics.median(samples) * 1000:8.3f} ms")
+
+            if max_ms_per_mb is not None and ms_per_mb > max_ms_per_mb:
+                print(f"    REGRESSION: {ms_per_mb:.1f} ms/MB exceeds budget of {max_ms_per_mb:.1f} ms/MB")
+                ok = False
+
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Speed and accuracy benchmark for ReportParser over synthetic reports (run as: python -m tests.benchmark_parser)"
+    )
+
+    parser.add_argument(
+        "--pages",
+        type=int,
+        nargs="+",
+        default=DEFAULT_PAGES,
+        help="Report sizes to benchmark, in pages"
+    )
+
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        nargs="+",
+        default=LAYOUTS,
+        help="Header layouts to benchmark"
+    )
+
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size and layout")
+    parser.add_argument("--top", type=int, default=5, help="Slowest extraction calls to show")
+
+    parser.add_argument(
+        "--max-ms-per-mb",
+        type=float,
+        default=None,
+        help="Exit with status 1 if parse() time per MB of text exceeds this budget"
+    )
+
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the measured field accuracy as the new regression baseline"
+    )
+
+    args = parser.parse_args()
+
+    timing_ok = run_benchmark(args.pages, args.layout, args.repeat, args.top, args.max_ms_per_mb)
+    accuracy_ok = run_accuracy(args.layout, args.update_baseline)
+
+    if not (timing_ok and accuracy_ok):
+        sys.exit(1)
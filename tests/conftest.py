@@ -0,0 +1,8 @@
+import os
+
+# app.core.config builds Settings at import time; unit tests never reach GCP.
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("GCP_LOCATION", "us")
+os.environ.setdefault("DOCUMENT_AI_PROCESSOR_ID", "test-processor")
+os.environ.setdefault("GCS_BUCKET_NAME", "bucket")
+os.environ.setdefault("API_KEY", "test-key")
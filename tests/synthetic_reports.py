@@ -0,0 +1,130 @@
+import argparse
+import random
+from dataclasses import dataclass
+
+PATIENT_NAMES = ["Luna", "Rocco", "Milo", "Nina", "Toby", "Lola", "Simba", "Kira", "Bruno", "Mora"]
+OWNER_NAMES = ["María González", "Juan Pérez", "Lucía Fernández", "Martín Rodríguez", "Sofía López"]
+SPECIES = [("Canino", ["Labrador", "Caniche", "Mestizo", "Ovejero Alemán"]), ("Felino", ["Europeo", "Siamés", "Persa"])]
+VETERINARIANS = ["Dra. Paula Méndez", "Dr. Andrés Castro", "Dra. Julieta Ríos"]
+CLINICS = ["Clínica Veterinaria San Roque", "Hospital Veterinario Del Sur", "Centro Veterinario Palermo"]
+
+FINDINGS = [
+    "Silueta cardíaca aumentada de tamaño compatible con cardiomegalia.",
+    "Se observa efusión pleural bilateral de moderada cantidad.",
+    "Patrón pulmonar intersticial difuso en campos caudales.",
+    "Hígado de tamaño conservado, ecogenicidad homogénea.",
+    "Riñones de forma y tamaño normales, relación corticomedular conservada.",
+    "Vejiga con contenido anecoico, pared de espesor normal.",
+    "Bazo sin alteraciones ecográficas evidentes.",
+    "Columna vertebral con espondilosis deformante en segmento lumbar.",
+    "Estómago con contenido alimenticio, sin signos de obstrucción.",
+    "Asas intestinales con peristaltismo conservado.",
+]
+CONCLUSIONS = [
+    "Hallazgos compatibles con insuficiencia cardíaca congestiva.",
+    "Efusión pleural de origen a determinar.",
+    "Estudio abdominal dentro de parámetros normales.",
+    "Enfermedad degenerativa articular leve.",
+]
+RECOMMENDATIONS = [
+    "Se sugiere ecocardiografía y control radiológico en 15 días.",
+    "Realizar toracocentesis diagnóstica y análisis del líquido.",
+    "Control clínico con su veterinario de cabecera.",
+    "Evaluar función renal mediante análisis de sangre.",
+]
+
+LINES_PER_PAGE = 45
+LAYOUTS = ["stacked", "inline"]
+
+# Report fields whose true value the generator knows, as dotted paths into Report.
+EXPECTED_FIELDS = [
+    "patient.name", "patient.species", "patient.breed", "patient.sex", "patient.age",
+    "owner.name", "owner.contact", "veterinarian.name", "veterinarian.clinic", "recommendations",
+]
+
+
+@dataclass
+class SyntheticReport:
+    text: str
+    expected: dict
+
+
+def _header(rng: random.Random, layout: str, clinic: str, expected: dict) -> list:
+    species, breeds = rng.choice(SPECIES)
+    fields = {
+        "Paciente": rng.choice(PATIENT_NAMES),
+        "Especie": species,
+        "Raza": rng.choice(breeds),
+        "Sexo": rng.choice(["Macho", "Hembra"]),
+        "Edad": f"{rng.randint(1, 16)} años",
+        "Propietario": rng.choice(OWNER_NAMES),
+        "Teléfono": f"11-{rng.randint(4000, 6999)}-{rng.randint(1000, 9999)}",
+        "Veterinario responsable": rng.choice(VETERINARIANS),
+        "Clínica": clinic,
+        "Fecha": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2026",
+    }
+    expected.update({
+        "patient.name": fields["Paciente"],
+        "patient.species": fields["Especie"],
+        "patient.breed": fields["Raza"],
+        "patient.sex": fields["Sexo"],
+        "patient.age": fields["Edad"],
+        "owner.name": fields["Propietario"],
+        "owner.contact": fields["Teléfono"],
+        "veterinarian.name": fields["Veterinario responsable"],
+        "veterinarian.clinic": fields["Clínica"],
+    })
+    if layout == "inline":
+        # Several labels share a visual line, as OCR returns for two-column headers.
+        items = [f"{key}: {value}" for key, value in fields.items()]
+        return ["  ".join(items[i:i + 3]) for i in range(0, len(items), 3)]
+    return [f"{key}: {value}" for key, value in fields.items()]
+
+
+def generate_report(pages: int = 1, layout: str = "stacked", seed: int = 0) -> SyntheticReport:
+    """
+    Builds OCR-like text for a veterinary report spanning roughly `pages` pages,
+    together with the value the parser should extract for each of EXPECTED_FIELDS.
+    The clinic letterhead repeats on every page, as it does in real scans.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout}'. Expected one of {LAYOUTS}.")
+
+    rng = random.Random(seed)
+    clinic = rng.choice(CLINICS)
+    expected = {}
+    lines = _header(rng, layout, clinic, expected)
+    lines.append("")
+    lines.append(rng.choice(["ESTUDIO RADIOLOGICO", "INFORME ECOGRÁFICO", "HALLAZGOS ECOGRÁFICOS"]))
+
+    findings_lines = max(LINES_PER_PAGE * pages - len(lines) - 12, 1)
+    for n in range(findings_lines):
+        if n and n % LINES_PER_PAGE == 0:
+            lines.append(clinic.upper())
+            lines.append(f"Página {n // LINES_PER_PAGE + 1} de {pages}")
+        lines.append(rng.choice(FINDINGS))
+
+    lines.append("")
+    lines.append("CONCLUSION:")
+    lines.extend(rng.sample(CONCLUSIONS, 2))
+    lines.append("RECOMENDACIONES:")
+    recommendations = rng.sample(RECOMMENDATIONS, 2)
+    lines.extend(recommendations)
+    expected["recommendations"] = "\n".join(recommendations)
+    lines.append(rng.choice(VETERINARIANS))
+    lines.append(f"M.V. Mat. {rng.randint(1000, 9999)}")
+    return SyntheticReport(text="\n".join(lines), expected=expected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generates synthetic Spanish veterinary report text for parser benchmarks"
+    )
+
+    parser.add_argument("--pages", type=int, default=1, help="Approximate page count")
+    parser.add_argument("--layout", choices=LAYOUTS, default="stacked", help="Header layout")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+
+    print(generate_report(args.pages, args.layout, args.seed).text)
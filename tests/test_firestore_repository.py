@@ -0,0 +1,144 @@
+import base64
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import firestore
+from google.cloud.firestore_v1.transforms import Increment
+
+from app.services.firestore_repository import (
+    _apply_postings,
+    _decode_cursor,
+    _encode_cursor,
+    _filters_key,
+    _finish_indexing,
+)
+
+client = firestore.Client(project="test", credentials=AnonymousCredentials())
+search_terms = client.collection("search_terms")
+stats_ref = client.collection("search_stats").document("corpus")
+
+
+class FakeTransaction:
+    """Applies transactional writes to an in-memory dict keyed by document path."""
+
+    def __init__(self, store: dict):
+        self.store = store
+
+    def get_all(self, refs):
+        for ref in refs:
+            yield SimpleNamespace(reference=ref, exists=ref.path in self.store)
+
+    def set(self, ref, data, merge=False):
+        current = dict(self.store.get(ref.path, {})) if merge else {}
+        for key, value in data.items():
+            current[key] = current.get(key, 0) + value.value if isinstance(value, Increment) else value
+        self.store[ref.path] = current
+
+    def update(self, ref, data):
+        self.store[ref.path] = {**self.store.get(ref.path, {}), **data}
+
+    def delete(self, ref):
+        self.store.pop(ref.path, None)
+
+
+class FakeReportRef:
+    def __init__(self, store: dict, path: str):
+        self.store = store
+        self.path = path
+
+    def get(self, field_paths=None, transaction=None):
+        return SimpleNamespace(to_dict=lambda: self.store.get(self.path))
+
+
+def apply_postings(store, report_id, updates):
+    _apply_postings.to_wrap(FakeTransaction(store), search_terms, report_id, updates)
+
+
+def finish_indexing(store, report_ref, terms, length):
+    _finish_indexing.to_wrap(FakeTransaction(store), report_ref, stats_ref, terms, length)
+
+
+def test_reapplying_postings_does_not_double_count_df():
+    store = {}
+    updates = [("efusion", {"tf": 2, "impact": 1.5}), ("pleural", {"tf": 1, "impact": 1.0})]
+
+    apply_postings(store, "r1", updates)
+    apply_postings(store, "r1", updates)
+
+    assert store["search_terms/efusion"]["df"] == 1
+    assert store["search_terms/pleural"]["df"] == 1
+    assert store["search_terms/efusion/postings/r1"] == {"tf": 2, "impact": 1.5}
+
+
+def test_removing_a_missing_posting_leaves_df_unchanged():
+    store = {}
+    apply_postings(store, "r1", [("efusion", {"tf": 1, "impact": 1.0})])
+
+    apply_postings(store, "r1", [("efusion", None)])
+    apply_postings(store, "r1", [("efusion", None)])
+
+    assert store["search_terms/efusion"]["df"] == 0
+    assert "search_terms/efusion/postings/r1" not in store
+
+
+def test_finish_indexing_counts_each_report_once():
+    store = {"reports/r1": {"search": {"status": "pending"}}}
+    report_ref = FakeReportRef(store, "reports/r1")
+
+    finish_indexing(store, report_ref, ["efusion"], 10)
+    store["reports/r1"]["search"]["status"] = "pending"  # a later re-save marks it pending again
+    finish_indexing(store, report_ref, ["efusion", "pleural"], 14)
+
+    assert store["search_stats/corpus"] == {"documents": 1, "total_length": 14}
+    assert store["reports/r1"]["search"] == {"status": "indexed", "terms": ["efusion", "pleural"], "length": 14}
+
+
+CANINE_FILTERS = {"index.patient_name": None, "index.owner_name": None, "index.species": "canino", "index.clinic": None}
+CREATED_AT = datetime(2026, 2, 4, 1, 11, 5, 123456, tzinfo=timezone.utc)
+
+
+def encode_payload(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def test_cursor_round_trips():
+    key = _filters_key(CANINE_FILTERS, CREATED_AT, None)
+    cursor = _encode_cursor(CREATED_AT, "report-1", key)
+
+    assert _decode_cursor(cursor, key) == (CREATED_AT, "report-1")
+
+
+def test_filters_key_depends_on_every_filter():
+    base = _filters_key(CANINE_FILTERS, None, None)
+
+    assert _filters_key({**CANINE_FILTERS, "index.species": "felino"}, None, None) != base
+    assert _filters_key(CANINE_FILTERS, CREATED_AT, None) != base
+    assert _filters_key(CANINE_FILTERS, None, CREATED_AT) != base
+
+
+def test_cursor_replayed_with_different_filters_is_rejected():
+    cursor = _encode_cursor(CREATED_AT, "report-1", _filters_key(CANINE_FILTERS, None, None))
+    other_key = _filters_key({**CANINE_FILTERS, "index.species": "felino"}, None, None)
+
+    with pytest.raises(ValueError, match="does not match"):
+        _decode_cursor(cursor, other_key)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "eyJj",  # truncated base64
+    base64.urlsafe_b64encode(b"not json").decode("ascii"),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode("ascii"),
+    encode_payload(["c", "id", "f"]),
+    encode_payload({"id": "report-1", "f": "key"}),
+    encode_payload({"c": CREATED_AT.isoformat(), "f": "key"}),
+    encode_payload({"c": CREATED_AT.isoformat(), "id": "report-1"}),
+    encode_payload({"c": "yesterday", "id": "report-1", "f": "key"}),
+])
+def test_malformed_cursor_is_invalid(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_cursor(cursor, "key")
@@ -0,0 +1,47 @@
+import pytest
+
+from app.services.report_parser import ReportParser
+from tests.benchmark_parser import field_value, load_accuracy_baseline, measure_accuracy
+from tests.synthetic_reports import EXPECTED_FIELDS, LAYOUTS, generate_report
+
+
+@pytest.mark.parametrize("pages", [1, 30])
+@pytest.mark.parametrize("seed", range(5))
+def test_stacked_layout_extracts_every_field(pages, seed):
+    sample = generate_report(pages=pages, layout="stacked", seed=seed)
+    report = ReportParser(sample.text).parse()
+
+    for path in EXPECTED_FIELDS:
+        assert field_value(report, path) == sample.expected[path], path
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_field_accuracy_does_not_regress(layout):
+    baseline = load_accuracy_baseline()[layout]
+    measured = measure_accuracy(layout)
+
+    regressions = {path: measured[path] for path in EXPECTED_FIELDS if measured[path] < baseline[path]}
+    assert not regressions
+
+
+def test_extract_field_stops_at_next_label_on_same_line():
+    parser = ReportParser("Paciente: Luna  Especie: Canino\nSexo: Hembra  Edad: 3 años")
+
+    assert parser._extract_field(["Paciente"], stop_words=["Especie"]) == "Luna"
+    assert parser._extract_field(["Sexo"], stop_words=["Edad"]) == "Hembra"
+
+
+def test_extract_block_stops_at_signature():
+    parser = ReportParser("RECOMENDACIONES:\nControl en 15 días.\nDieta renal.\nDr. Andrés Castro\nM.V. Mat. 1234")
+
+    block = parser._extract_block(start_keys=["RECOMENDACIONES"], end_keys=["Dr.", "M.V."], ignore_lines=[])
+
+    assert block == "Control en 15 días.\nDieta renal."
+
+
+def test_parse_returns_empty_fields_for_unlabelled_text():
+    report = ReportParser("Texto libre sin etiquetas reconocibles.").parse()
+
+    assert report.patient.name is None
+    assert report.diagnosis is None
+    assert report.recommendations is None
@@ -0,0 +1,83 @@
+from app.services.normalization import fold_accents, normalize
+from app.services.search import analyze, idf, impact, query_terms, rank, stem
+
+
+def test_fold_accents_removes_diacritics():
+    assert fold_accents("Clínica Ñandú efusión") == "Clinica Nandu efusion"
+
+
+def test_normalize_lowercases_and_collapses_whitespace():
+    assert normalize("  Clínica   Veterinaria\nSAN Roque ") == "clinica veterinaria san roque"
+
+
+def test_normalize_returns_none_for_empty_values():
+    assert normalize(None) is None
+    assert normalize("") is None
+    assert normalize("   ") is None
+
+
+def test_stem_merges_plural_and_gender_forms():
+    assert stem("efusiones") == stem("efusion") == "efusion"
+    assert stem("cardiomegalias") == stem("cardiomegalia")
+    assert stem("pleurales") == stem("pleural") == "pleural"
+    assert stem("clinicas") == stem("clinico")
+
+
+def test_stem_applies_plural_and_gender_after_derivational_suffix():
+    assert stem("clinicamente") == stem("clinico") == "clinic"
+    assert stem("posibilidades") == stem("posibilidad")
+
+
+def test_stem_does_not_overstem_nouns():
+    assert stem("tratamiento") == stem("tratamientos") == "tratamient"
+
+
+def test_stem_leaves_short_words_untouched():
+    assert stem("masa") == "masa"
+    assert stem("ojo") == "ojo"
+
+
+def test_analyze_folds_accents_and_drops_stop_words():
+    assert analyze("Efusión pleural con cardiomegalia") == ["efusion", "pleural", "cardiomegali"]
+    assert analyze("clínicamente clínico") == ["clinic", "clinic"]
+
+
+def test_analyze_handles_empty_text():
+    assert analyze(None) == []
+    assert analyze("de la y") == []
+
+
+def test_query_terms_are_unique_and_ordered():
+    assert query_terms("efusiones efusión pleural") == ["efusion", "pleural"]
+
+
+def test_impact_favours_frequent_terms_in_short_reports():
+    assert impact(3, 10, 20) > impact(1, 10, 20)
+    assert impact(1, 10, 20) > impact(1, 80, 20)
+
+
+def test_idf_favours_rare_terms():
+    assert idf(1, 1000) > idf(500, 1000) > 0
+
+
+def test_rank_uses_corpus_document_frequencies():
+    postings = {
+        "cardiomegali": [("a", 1.0), ("b", 1.0)],
+        "efusion": [("b", 1.0)],
+    }
+    ranked = rank(postings, df={"cardiomegali": 900, "efusion": 5}, n_docs=1000, limit=10)
+
+    assert [report_id for report_id, _ in ranked] == ["b", "a"]
+    assert ranked[1][1] == idf(900, 1000)
+    assert ranked[0][1] == idf(900, 1000) + idf(5, 1000)
+
+
+def test_rank_keeps_top_k_by_score():
+    postings = {"efusion": [(str(i), float(i)) for i in range(50)]}
+    ranked = rank(postings, df={"efusion": 50}, n_docs=1000, limit=3)
+
+    assert [report_id for report_id, _ in ranked] == ["49", "48", "47"]
+
+
+def test_rank_handles_no_postings():
+    assert rank({}, df={}, n_docs=0, limit=5) == []
@@ -0,0 +1,74 @@
+import hashlib
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import PreconditionFailed
+
+from app.services import storage
+from app.services.storage import StorageService
+
+CONTENT = b"page-image-bytes"
+BLOB_NAME = f"images/{hashlib.sha256(CONTENT).hexdigest()}.jpeg"
+GCS_URI = f"gs://bucket/{BLOB_NAME}"
+
+
+@pytest.fixture(autouse=True)
+def empty_blob_cache():
+    storage._known_blobs.clear()
+    yield
+    storage._known_blobs.clear()
+
+
+def make_service(blob: mock.Mock) -> StorageService:
+    service = StorageService.__new__(StorageService)
+    service.bucket_name = "bucket"
+    service.client = mock.Mock()
+    service.client.bucket.return_value.blob.return_value = blob
+    return service
+
+
+def upload(service: StorageService) -> str:
+    return service._upload_content_addressed_sync(CONTENT, "images", "jpeg", "image/jpeg")
+
+
+def test_new_content_is_uploaded_once_under_its_hash():
+    blob = mock.Mock()
+    service = make_service(blob)
+
+    assert upload(service) == GCS_URI
+    service.client.bucket.return_value.blob.assert_called_once_with(BLOB_NAME)
+    blob.upload_from_string.assert_called_once_with(CONTENT, content_type="image/jpeg", if_generation_match=0)
+
+
+def test_cache_hit_skips_gcs_entirely():
+    storage._remember_blob(BLOB_NAME)
+    blob = mock.Mock()
+    service = make_service(blob)
+
+    assert upload(service) == GCS_URI
+    service.client.bucket.assert_not_called()
+    blob.upload_from_string.assert_not_called()
+
+
+def test_blob_already_in_bucket_is_not_overwritten():
+    blob = mock.Mock()
+    blob.upload_from_string.side_effect = PreconditionFailed("exists")
+    service = make_service(blob)
+
+    assert upload(service) == GCS_URI
+    assert upload(service) == GCS_URI
+    # The rejected write is remembered, so the second call never reaches GCS.
+    blob.upload_from_string.assert_called_once()
+
+
+def test_concurrent_upload_race_returns_shared_blob():
+    def lose_race(*args, **kwargs):
+        storage._remember_blob(BLOB_NAME)  # the other request finished first
+        raise PreconditionFailed("generation mismatch")
+
+    blob = mock.Mock()
+    blob.upload_from_string.side_effect = lose_race
+    service = make_service(blob)
+
+    assert upload(service) == GCS_URI
+    assert storage._is_known_blob(BLOB_NAME)